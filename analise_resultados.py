@@ -1,7 +1,8 @@
 # analise_resultados.py
 """
 Script para gerar estatísticas descritivas e testes inferenciais
-a partir do arquivo 'resultados_amostras.csv' (formato: TSV ou CSV com separador tab ou vírgula).
+a partir do arquivo 'resultados_amostras.csv' (CSV separado por vírgula, gerado por experimento_busca.py),
+ou de 'resultados_amostras.parquet', preferido quando existe.
 Saídas:
 - estatisticas_amostra_completa.csv  -> estatísticas por coluna (lista e dicionário)
 - estatisticas_blocos.csv            -> (opcional) estatísticas por blocos se desejar
@@ -11,7 +12,6 @@ Saídas:
 import os
 import sys
 import math
-import csv
 from collections import OrderedDict
 import statistics as stats
 
@@ -25,29 +25,23 @@ except Exception:
     SCIPY = False
 
 INPUT = 'resultados_amostras.csv'  # ajuste se necessário
-SEP_TRY = [',', '\t', ';']
+# tipos fixos das colunas gravadas por experimento_busca.salvar_amostras_csv
+DTYPES = {'valor': 'int64', 'tempo_lista_ns': 'int64', 'tempo_dict_ns': 'int64'}
+
+def parquet_path(path):
+    return os.path.splitext(path)[0] + '.parquet'
 
 def read_table(path):
-    # tenta inferir separador simples
-    for sep in SEP_TRY:
+    # Parquet gravado junto com o CSV é mais rápido de recarregar (se houver engine)
+    if os.path.exists(parquet_path(path)):
         try:
-            if SCIPY:
-                df = pd.read_csv(path, sep=sep)
-            else:
-                # fallback com csv.reader
-                with open(path, 'r', encoding='utf-8') as f:
-                    reader = csv.reader(f, delimiter=sep)
-                    header = next(reader)
-                    rows = list(reader)
-                import numpy as np
-                df = pd.DataFrame(rows, columns=header)
-            # verifica se as colunas esperadas existem
-            cols = [c.strip().lower() for c in df.columns]
-            if any('lista' in c for c in cols) and any('dict' in c or 'dicion' in c for c in cols):
-                return df
-        except Exception:
-            continue
-    raise RuntimeError("Não foi possível ler o arquivo. Verifique separador e formatação (esperado: colunas 'tempo_lista_ns' e 'tempo_dict_ns').")
+            return pd.read_parquet(parquet_path(path))
+        except ImportError:
+            pass
+    # o produtor sempre grava CSV separado por vírgula: sem tentativa de
+    # separadores e sem inferência de tipos para as colunas conhecidas;
+    # memory_map deixa o kernel paginar o arquivo e low_memory=False lê em um só bloco
+    return pd.read_csv(path, sep=',', engine='c', memory_map=True, low_memory=False, dtype=DTYPES)
 
 def ensure_numeric(series):
     # converte colunas para numéricas (inteiros)
@@ -78,23 +72,24 @@ def descriptive_stats(arr):
 
 def welch_ttest(x, y):
     """Calcula t, df e p-values (two-tailed e one-tailed).
-    Usa scipy se disponível; caso contrário calcula manualmente."""
+    Usa scipy.stats.ttest_ind(equal_var=False) se disponível; caso contrário calcula t manualmente."""
     n1 = len(x); n2 = len(y)
-    m1 = np.mean(x); m2 = np.mean(y)
     s1 = np.var(x, ddof=1); s2 = np.var(y, ddof=1)  # variâncias amostrais
-    t = (m1 - m2) / math.sqrt(s1/n1 + s2/n2)
     # df de Welch:
     df = (s1/n1 + s2/n2)**2 / ((s1**2)/((n1**2)*(n1-1)) + (s2**2)/((n2**2)*(n2-1)))
     if SCIPY:
-        # p two-tailed
-        p_two = 2 * sps.t.sf(abs(t), df)
-    else:
-        # fallback: aproximação via t-distribution usando scipy não disponível -> usar math, mas sem p precisa
-        p_two = None
-    return {'t': float(t), 'df': float(df), 'p_two': p_two, 'p_left': None, 'p_right': None}
+        t, p_two = sps.ttest_ind(x, y, equal_var=False)
+        # p left: prob(mean_lista < mean_dict); t negativo implica mean(lista) < mean(dict)
+        p_left = sps.t.cdf(t, df)
+        return {'t': float(t), 'df': float(df), 'p_two': float(p_two),
+                'p_left': float(p_left), 'p_right': float(1 - p_left)}
+    # fallback: sem scipy não há distribuição t para os p-values
+    m1 = np.mean(x); m2 = np.mean(y)
+    t = (m1 - m2) / math.sqrt(s1/n1 + s2/n2)
+    return {'t': float(t), 'df': float(df), 'p_two': None, 'p_left': None, 'p_right': None}
 
 def main():
-    if not os.path.exists(INPUT):
+    if not os.path.exists(INPUT) and not os.path.exists(parquet_path(INPUT)):
         print("Arquivo de entrada não encontrado:", INPUT)
         sys.exit(1)
     df = read_table(INPUT)
@@ -134,18 +129,6 @@ def main():
     stats_dict = descriptive_stats(y)
     # teste de Welch (usando scipy se disponível)
     res_welch = welch_ttest(x, y)
-    # se scipy disponível, calcula p unilateral também
-    if SCIPY and res_welch['p_two'] is not None:
-        p_two = res_welch['p_two']
-        # p left: prob(mean_lista < mean_dict)
-        # t negative implies mean(lista) < mean(dict)
-        # compute cdf
-        t = res_welch['t']; dfw = res_welch['df']
-        p_left = sps.t.cdf(t, dfw)
-        p_right = 1 - p_left
-        res_welch['p_two'] = p_two
-        res_welch['p_left'] = p_left
-        res_welch['p_right'] = p_right
     # grava resultados em arquivo legível
     with open('resultados_console.txt', 'w', encoding='utf-8') as f:
         f.write("ESTATÍSTICA DESCRITIVA - LISTA\n")
@@ -1,38 +1,50 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import csv
+import os
 import numpy as np
-import math
+import pandas as pd
 import statistics
-from scipy.stats import t as student_t
+from scipy.stats import t as student_t, ttest_ind
 
 # ==========================================
 # CONFIGURAÇÃO DO ARQUIVO
 # ==========================================
 
 CSV_AMOSTRAS = "resultados_amostras.csv"   # Deve estar na mesma pasta
+# o .parquet de mesmo nome base, se existir, é preferido ao CSV
 
 # ==========================================
 # CARREGAR DADOS
 # ==========================================
 
-tempos_lista = []
-tempos_dict = []
-amostras_raw = []
-
-with open(CSV_AMOSTRAS, newline='') as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        # assume cabeçalhos: valor, tempo_lista_ns, tempo_dict_ns
-        tl = int(row["tempo_lista_ns"])
-        td = int(row["tempo_dict_ns"])
-        tempos_lista.append(tl)
-        tempos_dict.append(td)
-        amostras_raw.append((int(row["valor"]), tl, td))
-
-tempos_lista = np.array(tempos_lista)
-tempos_dict = np.array(tempos_dict)
+# assume cabeçalhos: valor, tempo_lista_ns, tempo_dict_ns
+def caminho_parquet(caminho):
+    # Parquet gravado junto com o CSV, com o mesmo nome base
+    return os.path.splitext(caminho)[0] + ".parquet"
+
+
+def ler_amostras(caminho):
+    # Parquet primeiro (mais rápido de recarregar), se existir e houver engine
+    if os.path.exists(caminho_parquet(caminho)):
+        try:
+            return pd.read_parquet(caminho_parquet(caminho))
+        except ImportError:
+            pass
+    # leitura em bloco pelo parser C, sem inferência de separador/tipos
+    return pd.read_csv(
+        caminho,
+        sep=",",
+        engine="c",
+        memory_map=True,
+        low_memory=False,
+        dtype={"valor": np.int64, "tempo_lista_ns": np.int64, "tempo_dict_ns": np.int64},
+    )
+
+
+dados = ler_amostras(CSV_AMOSTRAS)
+tempos_lista = dados["tempo_lista_ns"].to_numpy()
+tempos_dict = dados["tempo_dict_ns"].to_numpy()
 
 print("==========================================")
 print(" TAMANHO DA AMOSTRA ")
@@ -77,22 +89,16 @@ print()
 # WELCH T-TEST (EXATO VIA SCIPY)
 # ==========================================
 
-mx, my = res_lista["mean"], res_dict["mean"]
-vx, vy = res_lista["std_pop"]**2, res_dict["std_pop"]**2
+# variâncias amostrais (ddof=1), como pede Welch-Satterthwaite
+vx, vy = tempos_lista.var(ddof=1), tempos_dict.var(ddof=1)
 nx, ny = res_lista["n"], res_dict["n"]
 
-# erro padrão
-se = math.sqrt(vx/nx + vy/ny)
-
-# estatística t
-t_stat = (mx - my) / se
+# estatística t e p-value exato — bicaudal (Welch, direto sobre as amostras)
+t_stat, p_two = ttest_ind(tempos_lista, tempos_dict, equal_var=False)
 
 # graus de liberdade (Welch-Satterthwaite)
 df = (vx/nx + vy/ny)**2 / ((vx*vx)/(nx*nx*(nx-1)) + (vy*vy)/(ny*ny*(ny-1)))
 
-# p-value exato — bicaudal
-p_two = 2 * student_t.sf(abs(t_stat), df)
-
 # unicaudais
 p_left = student_t.cdf(t_stat, df)     # lista < dicionário
 p_right = 1 - p_left                   # lista > dicionário
@@ -2,15 +2,17 @@
 # -*- coding: utf-8 -*-
 """
 experimento_busca.py
-Experimento: Busca em Lista (range) vs Dicionário (dict) em Python
+Experimento: Busca em Lista (varredura linear) vs Dicionário (acesso direto) em Python
 Configuração fixa (padrão para entrega):
-    - NUM_ELEMENTOS = 7_000_000
+    - NUM_ELEMENTOS = 100_000
     - NUM_BUSCAS = 4_000_000
     - N_BLOCKS = 4
     - TAMANHO_SAMPLE = 1000
+    - TAMANHO_LOTE = 1000
 
 Arquivos de saída:
     - resultados_amostras.csv      (1000 amostras representativas)
+    - resultados_amostras.parquet  (mesmas amostras; requer pyarrow ou fastparquet)
     - estatisticas_blocos.csv      (estatísticas por bloco)
     - estatisticas_completas.txt   (estatísticas globais)
 
@@ -21,25 +23,56 @@ Referências / templates usados no relatório:
 Observações:
     - O código foi modularizado para clareza e testabilidade.
     - Docstrings seguem o estilo Google.
-    - Testado para rodar em máquinas com ~8 GB RAM (feche apps pesados antes de executar).
+    - A "lista" é uma lista real (list(range(n)), ou np.arange com USAR_NUMBA) e a
+      busca é uma varredura linear de verdade. Com range(), 'valor in range' é O(1)
+      (apenas uma comparação) e o experimento não media busca em lista; por isso
+      NUM_ELEMENTOS foi reduzido de 7_000_000 para 100_000, para que as 4_000_000
+      buscas lineares terminem em tempo viável (~35 min sem Numba, ~4 min com Numba).
+    - As buscas são cronometradas em lotes de TAMANHO_LOTE (um único par de
+      perf_counter_ns por lote, como no timeit); o tempo por busca é o total do
+      lote, descontada a sobrecarga fixa de um lote vazio (chamada ao kernel mais o
+      par de perf_counter_ns, medida em cada bloco), dividido por TAMANHO_LOTE. Apenas as amostras do CSV usam medição unitária:
+      uma busca por par de perf_counter_ns, sempre em Python puro (list e int Python),
+      em qualquer modo. Esses tempos incluem a sobrecarga do relógio (não descontada),
+      medida no mesmo processo das amostras e gravada em estatisticas_completas.txt.
+      Por isso, nas estatísticas por bloco e globais, 'n_lotes' conta lotes (não
+      buscas) e pstdev, quantis, min e max descrevem a dispersão entre médias de
+      lotes, não entre buscas individuais.
+    - O "dicionário" é um vetor booleano np.ones(NUM_ELEMENTOS) indexado pela chave:
+      como as chaves são densas (0..n-1), a semântica é a mesma de um dict com valor
+      True, com uma fração da memória.
+    - USAR_NUMBA escolhe explicitamente o que é medido: True compila os laços de
+      busca por lote com Numba (sobre np.ndarray); False mede laços CPython (sobre
+      list). Os tempos dos dois modos não são comparáveis entre si; o modo usado é
+      gravado em estatisticas_completas.txt.
+    - Os blocos são independentes e podem rodar em paralelo (N_PROCESSOS processos),
+      cada um com suas próprias estruturas e gerador aleatório. O padrão é 1 (em série):
+      processos simultâneos disputam cache e banda de memória e alteram os tempos. O
+      número de processos é gravado em estatisticas_completas.txt.
 """
 
 from __future__ import annotations
 
-import csv
-import math
-import random
+import os
 import time
-from array import array
-from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
 
 # -----------------------
 # CONSTANTES DE CONFIGURAÇÃO (MANTIDAS FIXAS)
 # -----------------------
-NUM_ELEMENTOS: int = 7_000_000     # tamanho da lista e do dicionário (A)
+NUM_ELEMENTOS: int = 100_000       # tamanho da lista e do dicionário (A)
 NUM_BUSCAS: int = 4_000_000        # número total de buscas (B)
 N_BLOCKS: int = 4                  # número de blocos para divisão interna
 TAMANHO_SAMPLE: int = 1000         # número de amostras a salvar no CSV (C)
+TAMANHO_LOTE: int = 1000           # buscas cronometradas juntas (deve dividir NUM_BUSCAS // N_BLOCKS)
+N_PROCESSOS: int = 1  # blocos executados em paralelo; > 1 gera medições simultâneas
+USAR_NUMBA: bool = True            # True: kernels compilados com Numba; False: laços CPython
+SEMENTE: Optional[int] = None      # semente do gerador PCG64 (None = entropia do sistema)
 
 PROGRESS_STEP: int = 100_000       # passo de progresso dentro de cada bloco
 
@@ -49,118 +82,279 @@ PROGRESS_STEP: int = 100_000       # passo de progresso dentro de cada bloco
 Estatisticas = Dict[str, float]
 BlocoStats = Dict[str, Any]
 Amostra = Tuple[int, int, int]  # (valor, tempo_lista_ns, tempo_dict_ns)
+Sobrecargas = Dict[str, float]  # sobrecargas medidas por bloco (ns)
+Lote = Union[List[int], np.ndarray]   # ints Python, ou np.ndarray int64 com USAR_NUMBA
+Lista = Union[List[int], np.ndarray]  # list, ou np.ndarray int64 com USAR_NUMBA
 
 
 # -----------------------
 # FUNÇÕES DE INFRAESTRUTURA
 # -----------------------
-def criar_estruturas(num_elementos: int) -> Tuple[range, Dict[int, bool]]:
+def criar_estruturas(num_elementos: int) -> Tuple[Lista, np.ndarray]:
     """
-    Cria as estruturas de teste: uma 'lista' representada por range()
-    e um dicionário com chaves de 0..num_elementos-1.
+    Cria as estruturas de teste: uma lista com os valores 0..num_elementos-1
+    e um "dicionário" com as mesmas chaves.
+
+    A lista é uma list Python (ou np.arange int64 com USAR_NUMBA, para ser usada no
+    código compilado); em ambos os casos 'valor in lista' é uma varredura linear.
+
+    Como as chaves são densas, o dicionário é um vetor booleano np.ones(num_elementos):
+    'dicionario[valor]' tem a mesma semântica de um dict com valor True, ocupa uma
+    fração da memória e pode ser usado dentro de código compilado.
 
     Args:
         num_elementos: número de elementos a gerar.
 
     Returns:
-        Uma tupla (lista_range, dicionario).
+        Uma tupla (lista, dicionario).
+    """
+    if USAR_NUMBA:
+        lista = np.arange(num_elementos, dtype=np.int64)
+    else:
+        lista = list(range(num_elementos))
+    dicionario = np.ones(num_elementos, dtype=np.bool_)
+    return lista, dicionario
+
+
+def _buscar_lote_lista(valores, lista):
+    """
+    Executa as buscas de um lote na lista, por varredura linear ('valor in lista').
+
+    Retorna o número de acertos para que o laço não seja eliminado pelo compilador.
+    """
+    acertos = 0
+    for v in valores:
+        if v in lista:
+            acertos += 1
+    return acertos
+
+
+def _buscar_lote_dict(valores, dicionario):
+    """
+    Executa as buscas de um lote no dicionário (vetor booleano indexado pela chave).
+
+    Retorna o número de acertos para que o laço não seja eliminado pelo compilador.
+    """
+    acertos = 0
+    for v in valores:
+        if dicionario[v]:
+            acertos += 1
+    return acertos
+
+
+if USAR_NUMBA:
+    # sem fallback silencioso: o modo de execução define o que está sendo medido
+    try:
+        from numba import njit
+    except ImportError as e:
+        raise ImportError("USAR_NUMBA = True requer o pacote numba; instale-o ou use USAR_NUMBA = False.") from e
+    _buscar_lote_lista = njit(cache=True)(_buscar_lote_lista)
+    _buscar_lote_dict = njit(cache=True)(_buscar_lote_dict)
+
+
+def medir_busca_lista(valores: Lote, lista: Lista) -> int:
+    """
+    Mede o tempo total (ns) para verificar se cada valor de 'valores' está em 'lista'.
+
+    Um único par de perf_counter_ns cobre o lote inteiro. O tempo inclui o custo
+    fixo da chamada e do relógio, a ser descontado com medir_sobrecarga_lote.
+
+    Args:
+        valores: lote de valores a buscar (ints Python, ou np.ndarray int64 com USAR_NUMBA).
+        lista: lista com os valores 0..NUM_ELEMENTOS-1.
+
+    Returns:
+        Tempo total do lote em nanossegundos (int).
+    """
+    t0 = time.perf_counter_ns()
+    _buscar_lote_lista(valores, lista)
+    t1 = time.perf_counter_ns()
+    return t1 - t0
+
+
+def medir_busca_dict(valores: Lote, dicionario: np.ndarray) -> int:
+    """
+    Mede o tempo total (ns) para verificar se cada valor de 'valores' está em 'dicionario'.
+
+    Args:
+        valores: lote de valores a buscar (ints Python, ou np.ndarray int64 com USAR_NUMBA).
+        dicionario: vetor booleano indexado pela chave.
+
+    Returns:
+        Tempo total do lote em nanossegundos (int).
+    """
+    t0 = time.perf_counter_ns()
+    _buscar_lote_dict(valores, dicionario)
+    t1 = time.perf_counter_ns()
+    return t1 - t0
+
+
+def medir_sobrecarga_lote(vazio: Lote, lista: Lista, dicionario: np.ndarray, repeticoes: int = 1_000) -> Tuple[float, float]:
+    """
+    Mede a sobrecarga fixa (ns) de um lote: chamada ao kernel mais o par de perf_counter_ns.
+
+    Cronometra lotes vazios pelas mesmas funções de medição; a mediana descarta
+    interrupções. Com Numba, o custo do despachante é da ordem de centenas de ns
+    e não é desprezível frente a um lote inteiro de buscas no dicionário.
+
+    Args:
+        vazio: lote vazio, do mesmo tipo dos lotes medidos.
+        lista: lista com os valores 0..NUM_ELEMENTOS-1.
+        dicionario: vetor booleano indexado pela chave.
+        repeticoes: número de lotes vazios cronometrados por estrutura.
+
+    Returns:
+        Uma tupla (sobrecarga_lista, sobrecarga_dict), em nanossegundos.
     """
-    lista_range = range(num_elementos)
-    dicionario = dict.fromkeys(range(num_elementos), True)
-    return lista_range, dicionario
+    tempos_lista = [medir_busca_lista(vazio, lista) for _ in range(repeticoes)]
+    tempos_dict = [medir_busca_dict(vazio, dicionario) for _ in range(repeticoes)]
+    return float(np.median(tempos_lista)), float(np.median(tempos_dict))
 
 
-def medir_busca_lista(valor: int, lista_range: range) -> int:
+def medir_busca_lista_unitaria(valor: int, lista: List[int]) -> int:
     """
-    Mede o tempo (ns) para verificar se 'valor' está em 'lista_range'.
+    Mede o tempo (ns) de uma única busca de 'valor' em 'lista', em Python puro.
+
+    Usada apenas para as amostras representativas do CSV; o tempo inclui a
+    sobrecarga das chamadas a perf_counter_ns (ver medir_sobrecarga_relogio).
 
     Args:
-        valor: valor a buscar.
-        lista_range: objeto range representando a "lista".
+        valor: valor a buscar (int Python).
+        lista: list Python com os valores 0..NUM_ELEMENTOS-1.
 
     Returns:
         Tempo em nanossegundos (int).
     """
     t0 = time.perf_counter_ns()
-    _ = valor in lista_range
+    _ = valor in lista
     t1 = time.perf_counter_ns()
     return t1 - t0
 
 
-def medir_busca_dict(valor: int, dicionario: Dict[int, bool]) -> int:
+def medir_busca_dict_unitaria(valor: int, dicionario: np.ndarray) -> int:
     """
-    Mede o tempo (ns) para verificar se 'valor' está em 'dicionario'.
+    Mede o tempo (ns) de uma única busca de 'valor' em 'dicionario', em Python puro.
 
     Args:
-        valor: valor a buscar.
-        dicionario: dicionário com chaves.
+        valor: valor a buscar (int Python).
+        dicionario: vetor booleano indexado pela chave.
 
     Returns:
         Tempo em nanossegundos (int).
     """
     t0 = time.perf_counter_ns()
-    _ = valor in dicionario
+    _ = bool(dicionario[valor])
     t1 = time.perf_counter_ns()
     return t1 - t0
 
 
+def medir_sobrecarga_relogio(repeticoes: int = 10_000) -> float:
+    """
+    Mede a sobrecarga (ns) de um par de perf_counter_ns sem nada entre eles.
+
+    É o piso das medições unitárias das amostras; a mediana descarta interrupções.
+
+    Args:
+        repeticoes: número de pares cronometrados.
+
+    Returns:
+        Mediana da sobrecarga em nanossegundos.
+    """
+    deltas = np.empty(repeticoes, dtype=np.int64)
+    for i in range(repeticoes):
+        t0 = time.perf_counter_ns()
+        t1 = time.perf_counter_ns()
+        deltas[i] = t1 - t0
+    return float(np.median(deltas))
+
+
 # -----------------------
 # FUNÇÕES ESTATÍSTICAS
 # -----------------------
-def calcular_estatisticas_simples(valores: List[int]) -> Estatisticas:
+def _quantis(arr: np.ndarray) -> Tuple[float, float, float]:
+    """
+    Calcula (q1, mediana, q3) com interpolação linear, numa única chamada a
+    np.quantile (que usa seleção parcial em vez de ordenar o vetor inteiro).
+    """
+    q1, mediana, q3 = np.quantile(arr, [0.25, 0.5, 0.75], method="linear")
+    return float(q1), float(mediana), float(q3)
+
+
+def calcular_estatisticas_simples(valores: np.ndarray) -> Estatisticas:
     """
-    Calcula estatísticas descritivas básicas para uma lista de inteiros.
+    Calcula estatísticas descritivas básicas para um vetor de tempos.
 
     Estatísticas retornadas: n, media, mediana, pstdev (desvio padrão populacional),
-    q1, q3, min, max.
+    q1, q3, min, max e m2 (soma dos quadrados dos desvios, usada para combinar
+    blocos em combinar_estatisticas).
 
     Args:
-        valores: lista de inteiros (tempos em ns).
+        valores: np.ndarray (ou sequência) de tempos em ns.
 
     Returns:
         Dicionário com as estatísticas.
     """
-    n = len(valores)
+    arr = np.asarray(valores)
+    n = arr.size
     if n == 0:
         raise ValueError("Lista de valores vazia para cálculo estatístico.")
 
-    # média
-    s = sum(valores)
-    mean = s / n
+    mean = arr.mean()
+    var = arr.var()  # ddof=0 (populacional)
+    q1, mediana, q3 = _quantis(arr)
 
-    # desvio padrão populacional (pstdev)
-    ssd = sum((x - mean) ** 2 for x in valores)
-    pstdev = math.sqrt(ssd / n)
+    return {
+        "n": float(n),
+        "media": float(mean),
+        "mediana": mediana,
+        "pstdev": float(np.sqrt(var)),
+        "q1": q1,
+        "q3": q3,
+        "min": float(arr.min()),
+        "max": float(arr.max()),
+        "m2": float(var * n),
+    }
+
+
+def combinar_estatisticas(parciais: List[Estatisticas], valores: np.ndarray) -> Estatisticas:
+    """
+    Combina estatísticas de blocos em estatísticas globais.
+
+    n, media, pstdev, min e max saem dos blocos em O(1) por bloco, combinando
+    (n, media, m2) pela fórmula paralela de Chan/Welford; apenas os quantis
+    precisam do vetor global 'valores'.
 
-    minimo = min(valores)
-    maximo = max(valores)
+    Args:
+        parciais: estatísticas de cada bloco (saída de calcular_estatisticas_simples).
+        valores: vetor com todas as medidas (para os quantis).
 
-    # quantis (usamos uma cópia ordenada)
-    sorted_vals = sorted(valores)
+    Returns:
+        Dicionário com as mesmas chaves de calcular_estatisticas_simples.
+    """
+    if not parciais:
+        raise ValueError("Nenhum bloco para combinar.")
 
-    def quantil(sorted_arr: List[int], q: float) -> float:
-        """
-        Calcula o quantil q em [0,1] com interpolação linear.
-        """
-        pos = q * (n - 1)
-        lo = int(pos)
-        hi = min(lo + 1, n - 1)
-        frac = pos - lo
-        return sorted_arr[lo] * (1 - frac) + sorted_arr[hi] * frac
+    n, mean, m2 = 0.0, 0.0, 0.0
+    for p in parciais:
+        n_b = p["n"]
+        total = n + n_b
+        delta = p["media"] - mean
+        mean += delta * n_b / total
+        m2 += p["m2"] + delta ** 2 * n * n_b / total
+        n = total
 
-    mediana = quantil(sorted_vals, 0.5)
-    q1 = quantil(sorted_vals, 0.25)
-    q3 = quantil(sorted_vals, 0.75)
+    q1, mediana, q3 = _quantis(np.asarray(valores))
 
     return {
-        "n": float(n),
-        "media": float(mean),
-        "mediana": float(mediana),
-        "pstdev": float(pstdev),
-        "q1": float(q1),
-        "q3": float(q3),
-        "min": float(minimo),
-        "max": float(maximo),
+        "n": n,
+        "media": mean,
+        "mediana": mediana,
+        "pstdev": float(np.sqrt(m2 / n)),
+        "q1": q1,
+        "q3": q3,
+        "min": min(p["min"] for p in parciais),
+        "max": max(p["max"] for p in parciais),
+        "m2": m2,
     }
 
 
@@ -175,11 +369,34 @@ def salvar_amostras_csv(amostras: List[Amostra], nome_arquivo: str = "resultados
         amostras: lista de tuplas (valor, tempo_lista_ns, tempo_dict_ns).
         nome_arquivo: nome do arquivo CSV a ser criado.
     """
-    with open(nome_arquivo, "w", newline="") as f:
-        escritor = csv.writer(f)
-        escritor.writerow(["valor", "tempo_lista_ns", "tempo_dict_ns"])
-        for linha in amostras:
-            escritor.writerow(linha)
+    arr = np.array(amostras, dtype=np.int64).reshape(-1, 3)
+    np.savetxt(nome_arquivo, arr, fmt="%d", delimiter=",",
+               header="valor,tempo_lista_ns,tempo_dict_ns", comments="")
+
+
+def salvar_amostras_parquet(amostras: List[Amostra], nome_arquivo: str = "resultados_amostras.parquet") -> bool:
+    """
+    Salva as amostras representativas em Parquet (zstd), formato mais rápido de
+    recarregar que CSV nos scripts de análise.
+
+    Args:
+        amostras: lista de tuplas (valor, tempo_lista_ns, tempo_dict_ns).
+        nome_arquivo: nome do arquivo Parquet a ser criado.
+
+    Returns:
+        True se o arquivo foi gravado; False se não há engine Parquet instalada. Nesse
+        caso um Parquet de execução anterior é removido, para que os scripts de análise
+        não o leiam no lugar do CSV atual.
+    """
+    df = pd.DataFrame(amostras, columns=["valor", "tempo_lista_ns", "tempo_dict_ns"])
+    df = df.astype({"valor": np.int64, "tempo_lista_ns": np.int64, "tempo_dict_ns": np.int64})
+    try:
+        df.to_parquet(nome_arquivo, compression="zstd", index=False)
+    except ImportError:
+        if os.path.exists(nome_arquivo):
+            os.remove(nome_arquivo)
+        return False
+    return True
 
 
 def salvar_estatisticas_blocos_csv(estat_blocos: List[BlocoStats], nome_arquivo: str = "estatisticas_blocos.csv") -> None:
@@ -191,59 +408,201 @@ def salvar_estatisticas_blocos_csv(estat_blocos: List[BlocoStats], nome_arquivo:
         nome_arquivo: nome do CSV de saída.
     """
     header = [
-        "bloco", "n",
+        "bloco", "n_lotes", "n_buscas",
         "lista_media", "lista_mediana", "lista_pstdev", "lista_q1", "lista_q3", "lista_min", "lista_max",
         "dict_media", "dict_mediana", "dict_pstdev", "dict_q1", "dict_q3", "dict_min", "dict_max"
     ]
-    with open(nome_arquivo, "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(header)
-        for s in estat_blocos:
-            writer.writerow([
-                s["bloco"], s["n"],
-                s["lista_media"], s["lista_mediana"], s["lista_pstdev"], s["lista_q1"], s["lista_q3"], s["lista_min"], s["lista_max"],
-                s["dict_media"], s["dict_mediana"], s["dict_pstdev"], s["dict_q1"], s["dict_q3"], s["dict_min"], s["dict_max"]
-            ])
+    pd.DataFrame(estat_blocos, columns=header).to_csv(nome_arquivo, index=False)
+
+
+def descrever_modo() -> str:
+    """
+    Descreve o modo de execução (USAR_NUMBA), gravado junto com os resultados.
+    """
+    if USAR_NUMBA:
+        return "Numba (laços compilados sobre np.ndarray)"
+    return "CPython (laços interpretados sobre list)"
+
+
+def descrever_processos() -> str:
+    """
+    Descreve N_PROCESSOS, sinalizando quando os blocos foram medidos simultaneamente.
+    """
+    if N_PROCESSOS > 1:
+        return f"{N_PROCESSOS} (medições simultâneas, disputando cache e memória)"
+    return f"{N_PROCESSOS} (em série)"
 
 
-def salvar_estatisticas_completas_txt(stats_lista: Estatisticas, stats_dict: Estatisticas, nome_arquivo: str = "estatisticas_completas.txt") -> None:
+def salvar_estatisticas_completas_txt(stats_lista: Estatisticas, stats_dict: Estatisticas, sobrecargas_blocos: List[Sobrecargas], entropia_semente: int, nome_arquivo: str = "estatisticas_completas.txt") -> None:
     """
     Salva estatísticas globais (lista e dicionário) em um arquivo de texto formatado.
 
     Args:
         stats_lista: estatísticas para a lista.
         stats_dict: estatísticas para o dicionário.
+        sobrecargas_blocos: sobrecargas medidas em cada bloco (ns).
+        entropia_semente: entropia da SeedSequence raiz; reproduz a execução via SEMENTE.
         nome_arquivo: nome do arquivo de saída.
     """
     with open(nome_arquivo, "w") as f:
         f.write("=== EXPERIMENTO: BUSCA EM LISTA VS DICIONÁRIO (POR BLOCOS) ===\n\n")
         f.write(f"Elementos: {NUM_ELEMENTOS:,}\n")
         f.write(f"Buscas totais: {NUM_BUSCAS:,}\n")
-        f.write(f"Número de blocos: {N_BLOCKS}\n\n")
+        f.write(f"Número de blocos: {N_BLOCKS}\n")
+        f.write(f"Buscas por lote cronometrado: {TAMANHO_LOTE:,}\n")
+        f.write(f"Modo de execução: {descrever_modo()}\n")
+        f.write(f"Processos em paralelo: {descrever_processos()}\n")
+        f.write(f"Semente (PCG64): {entropia_semente}\n")
+        f.write("Sobrecarga por lote descontada (chamada + relógio, lote vazio, mediana por bloco):\n")
+        for b, sob in enumerate(sobrecargas_blocos, start=1):
+            f.write(f"  bloco {b}: lista {sob['lote_lista']:.1f} ns, dicionário {sob['lote_dict']:.1f} ns\n")
+        f.write("  (já descontada das médias de lote abaixo)\n")
+        f.write("Sobrecarga do relógio (par de perf_counter_ns, mediana por bloco):\n")
+        for b, sob in enumerate(sobrecargas_blocos, start=1):
+            f.write(f"  bloco {b}: {sob['relogio']:.1f} ns\n")
+        f.write("  (não descontada: incluída nos tempos unitários de resultados_amostras.csv)\n\n")
+        f.write("Cada medida é o tempo médio por busca de um lote de buscas.\n")
+        f.write("'media' é a média por busca; pstdev, mediana, q1, q3, min e max\n")
+        f.write("descrevem a dispersão entre médias de lotes, não entre buscas individuais.\n\n")
 
         f.write("=== ESTATÍSTICAS GLOBAIS - LISTA ===\n")
-        for k, v in stats_lista.items():
-            f.write(f"{k}: {v}\n")
+        _escrever_estatisticas(f, stats_lista)
 
         f.write("\n=== ESTATÍSTICAS GLOBAIS - DICIONÁRIO ===\n")
-        for k, v in stats_dict.items():
+        _escrever_estatisticas(f, stats_dict)
+
+
+def _escrever_estatisticas(f, stats: Estatisticas) -> None:
+    """
+    Escreve uma estatística por linha; 'n' (número de lotes) vira 'n_lotes' e
+    é acompanhado do número de buscas correspondente. 'm2' é só o acumulador
+    interno de combinar_estatisticas e não entra no relatório.
+    """
+    for k, v in stats.items():
+        if k == "m2":
+            continue
+        if k == "n":
+            f.write(f"n_lotes: {int(v)}\n")
+            f.write(f"n_buscas: {int(v) * TAMANHO_LOTE}\n")
+        else:
             f.write(f"{k}: {v}\n")
 
 
 # -----------------------
 # FLUXO PRINCIPAL DO EXPERIMENTO (POR BLOCOS)
 # -----------------------
+def _executar_bloco(
+    bloco: int,
+    semente: np.random.SeedSequence,
+    block_size: int,
+    num_elementos: int,
+    tamanho_lote: int,
+    cota_amostras: int,
+) -> Tuple[np.ndarray, np.ndarray, List[Amostra], Sobrecargas]:
+    """
+    Executa um bloco completo, num processo próprio do ProcessPoolExecutor.
+
+    O bloco é medido em block_size // tamanho_lote lotes cheios. Cada processo
+    cria suas estruturas (mais barato que serializá-las entre processos) e seu
+    gerador PCG64, a partir de uma semente independente.
+
+    Args:
+        bloco: índice do bloco (0..N_BLOCKS-1), usado nas mensagens de progresso.
+        semente: SeedSequence exclusiva do bloco.
+        block_size: número de buscas do bloco.
+        num_elementos: tamanho da lista e do dicionário.
+        tamanho_lote: buscas cronometradas juntas.
+        cota_amostras: quantas amostras representativas este bloco deve coletar.
+
+    Returns:
+        Uma tupla (coletor_lista, coletor_dict, amostras, sobrecargas) com o tempo
+        médio por busca de cada lote (ns), as amostras unitárias do bloco e as
+        sobrecargas medidas no bloco ("lote_lista", "lote_dict", "relogio").
+    """
+    lista, dicionario = criar_estruturas(num_elementos)
+    lotes_por_bloco = block_size // tamanho_lote  # todos os lotes têm o mesmo tamanho
+    rng = np.random.Generator(np.random.PCG64(semente))
+
+    # compila (ou carrega do cache) os kernels antes de qualquer medição
+    if USAR_NUMBA:
+        aquecimento = np.zeros(1, dtype=np.int64)
+        _buscar_lote_lista(aquecimento, lista)
+        _buscar_lote_dict(aquecimento, dicionario)
+
+    print(f"Iniciando bloco {bloco + 1}/{N_BLOCKS}...")
+    inicio_bloco = time.perf_counter()
+    bloco_coletor_lista = np.empty(lotes_por_bloco, dtype=np.float64)
+    bloco_coletor_dict = np.empty(lotes_por_bloco, dtype=np.float64)
+    amostras: List[Amostra] = []
+
+    # sorteio vetorizado de todos os valores do bloco; sem USAR_NUMBA, tolist() devolve ints
+    # Python, mais rápidos de iterar e de comparar com a lista que escalares NumPy
+    valores_bloco = rng.integers(0, num_elementos, size=block_size, dtype=np.int64)
+    if not USAR_NUMBA:
+        valores_bloco = valores_bloco.tolist()
+
+    # custo fixo de um lote (chamada + relógio), descontado de cada lote medido
+    sobrecarga_lista, sobrecarga_dict = medir_sobrecarga_lote(valores_bloco[:0], lista, dicionario)
+    # piso das amostras unitárias, medido no processo que as coleta
+    sobrecargas: Sobrecargas = {
+        "lote_lista": sobrecarga_lista,
+        "lote_dict": sobrecarga_dict,
+        "relogio": medir_sobrecarga_relogio(),
+    }
+
+    # as amostras unitárias são sempre medidas em Python puro, sobre uma list
+    lista_amostras = lista.tolist() if USAR_NUMBA and cota_amostras > 0 else lista
+
+    proximo_progresso = PROGRESS_STEP
+    for lote in range(lotes_por_bloco):
+        inicio = lote * tamanho_lote
+        valores = valores_bloco[inicio:inicio + tamanho_lote]
+
+        # coletar amostras representativas (apenas as da cota do bloco), com medição
+        # unitária em Python puro (sem a sobrecarga de chamar um kernel compilado)
+        for k in range(min(tamanho_lote, cota_amostras - len(amostras))):
+            valor = int(valores[k])
+            amostras.append((
+                valor,
+                medir_busca_lista_unitaria(valor, lista_amostras),
+                medir_busca_dict_unitaria(valor, dicionario),
+            ))
+
+        # tempo por busca sintetizado a partir do tempo total do lote, sem a sobrecarga
+        # fixa (float64: sem arredondar, a média de um lote guarda a fração de ns)
+        tl = (medir_busca_lista(valores, lista) - sobrecarga_lista) / tamanho_lote
+        td = (medir_busca_dict(valores, dicionario) - sobrecarga_dict) / tamanho_lote
+
+        # escrita por índice no coletor do bloco
+        bloco_coletor_lista[lote] = tl
+        bloco_coletor_dict[lote] = td
+
+        # progresso interno (limiar, pois PROGRESS_STEP pode não ser múltiplo de tamanho_lote)
+        feitas = inicio + tamanho_lote
+        if feitas >= proximo_progresso:
+            while proximo_progresso <= feitas:
+                proximo_progresso += PROGRESS_STEP
+            pct = feitas / block_size * 100
+            tempo_decorrido = time.perf_counter() - inicio_bloco
+            print(f" Bloco {bloco+1}: {feitas:,}/{block_size:,} ({pct:.1f}%) — {tempo_decorrido:.1f}s")
+
+    tempo_fim_bloco = time.perf_counter()
+    print(f"Bloco {bloco+1} concluído em {tempo_fim_bloco - inicio_bloco:.1f}s\n")
+
+    return bloco_coletor_lista, bloco_coletor_dict, amostras, sobrecargas
+
+
 def executar_experimento_por_blocos() -> None:
     """
     Executa o experimento completo, dividido em blocos.
 
     O fluxo principal:
-        1. Cria estruturas (lista e dicionário).
-        2. Para cada bloco:
-           - executa BLOCK_SIZE buscas
-           - coleta tempos por bloco
-           - calcula estatísticas do bloco e armazena em 'estatisticas_blocos'
-        3. Após todos os blocos, calcula estatísticas globais (todas as medidas)
+        1. Distribui os blocos entre N_PROCESSOS processos; cada um:
+           - cria suas estruturas (lista e dicionário)
+           - executa BLOCK_SIZE buscas, em lotes de TAMANHO_LOTE
+           - coleta o tempo médio por busca de cada lote
+        2. Para cada bloco, calcula estatísticas e armazena em 'estatisticas_blocos'
+        3. Após todos os blocos, combina as estatísticas dos blocos em estatísticas globais
         4. Salva arquivos de saída: amostras CSV, estatísticas por bloco CSV e estatísticas globais TXT
     """
     # validações simples
@@ -255,61 +614,78 @@ def executar_experimento_por_blocos() -> None:
         raise ValueError("NUM_ELEMENTOS deve ser > 0.")
     if TAMANHO_SAMPLE < 0:
         raise ValueError("TAMANHO_SAMPLE não pode ser negativo.")
+    if TAMANHO_LOTE <= 0:
+        raise ValueError("TAMANHO_LOTE deve ser > 0.")
+    if N_PROCESSOS <= 0:
+        raise ValueError("N_PROCESSOS deve ser >= 1.")
+    # lotes cheios: cada média de lote tem o mesmo peso nas estatísticas
+    if (NUM_BUSCAS // N_BLOCKS) % TAMANHO_LOTE != 0:
+        raise ValueError("TAMANHO_LOTE deve dividir NUM_BUSCAS // N_BLOCKS (sem lote parcial).")
 
     # preparo
-    lista_range, dicionario = criar_estruturas(NUM_ELEMENTOS)
     block_size = NUM_BUSCAS // N_BLOCKS
-    # coletores globais (arrays compactos)
-    tempos_lista = array('I')  # tempos em ns (unsigned int)
-    tempos_dict = array('I')
+    lotes_por_bloco = block_size // TAMANHO_LOTE
+    # sementes independentes por bloco, derivadas de SEMENTE (reprodutível se fixada);
+    # as amostras continuam sendo as primeiras TAMANHO_SAMPLE buscas, na ordem dos blocos
+    semente_raiz = np.random.SeedSequence(SEMENTE)
+    sementes = semente_raiz.spawn(N_BLOCKS)
+    cotas = [max(0, min(block_size, TAMANHO_SAMPLE - b * block_size)) for b in range(N_BLOCKS)]
+
+    # coletores globais pré-alocados (um tempo médio por busca, em ns, para cada lote)
+    tempos_lista = np.empty(N_BLOCKS * lotes_por_bloco, dtype=np.float64)
+    tempos_dict = np.empty(N_BLOCKS * lotes_por_bloco, dtype=np.float64)
     amostras: List[Amostra] = []
     estatisticas_blocos: List[BlocoStats] = []
+    parciais_lista: List[Estatisticas] = []
+    parciais_dict: List[Estatisticas] = []
 
     print("CONFIGURAÇÃO DO EXPERIMENTO:")
     print(f"- Elementos (lista/dicionário): {NUM_ELEMENTOS:,}")
     print(f"- Buscas totais:                {NUM_BUSCAS:,}")
     print(f"- Blocos:                       {N_BLOCKS}")
     print(f"- Buscas por bloco (aprox):     {block_size:,}")
-    print(f"- Amostras salvas (CSV):        {TAMANHO_SAMPLE:,}\n")
+    print(f"- Buscas por lote cronometrado: {TAMANHO_LOTE:,}")
+    print(f"- Processos em paralelo:        {descrever_processos()}")
+    print(f"- Semente (PCG64):              {semente_raiz.entropy}")
+    print(f"- Amostras salvas (CSV):        {TAMANHO_SAMPLE:,}")
+    print(f"- Modo de execução:             {descrever_modo()}\n")
 
     tempo_inicio_total = time.perf_counter()
 
-    for bloco in range(N_BLOCKS):
-        print(f"Iniciando bloco {bloco + 1}/{N_BLOCKS}...")
-        inicio_bloco = time.perf_counter()
-        bloco_coletor_lista: List[int] = []
-        bloco_coletor_dict: List[int] = []
-
-        for i in range(block_size):
-            valor = random.randint(0, NUM_ELEMENTOS - 1)
-
-            tl = medir_busca_lista(valor, lista_range)
-            td = medir_busca_dict(valor, dicionario)
+    with ProcessPoolExecutor(max_workers=N_PROCESSOS) as executor:
+        resultados = list(executor.map(
+            _executar_bloco,
+            range(N_BLOCKS),
+            sementes,
+            repeat(block_size),
+            repeat(NUM_ELEMENTOS),
+            repeat(TAMANHO_LOTE),
+            cotas,
+        ))
 
-            # append em coletores compactos (garantimos corte caso valor exceda uint32)
-            tempos_lista.append(int(min(tl, 2**32 - 1)))
-            tempos_dict.append(int(min(td, 2**32 - 1)))
-
-            bloco_coletor_lista.append(int(min(tl, 2**32 - 1)))
-            bloco_coletor_dict.append(int(min(td, 2**32 - 1)))
+    tempo_fim_total = time.perf_counter()
+    print(f"Coleta completa. Tempo total: {tempo_fim_total - tempo_inicio_total:.1f}s\n")
 
-            # coletar amostras representativas (apenas primeiras TAMANHO_SAMPLE)
-            if len(amostras) < TAMANHO_SAMPLE:
-                amostras.append((valor, tl, td))
+    sobrecargas_blocos: List[Sobrecargas] = []
+    for bloco, (bloco_coletor_lista, bloco_coletor_dict, amostras_bloco, sobrecargas_bloco) in enumerate(resultados):
+        amostras.extend(amostras_bloco)
+        sobrecargas_blocos.append(sobrecargas_bloco)
 
-            # progresso interno
-            if (i + 1) % PROGRESS_STEP == 0:
-                pct = (i + 1) / block_size * 100
-                tempo_decorrido = time.perf_counter() - inicio_bloco
-                print(f" Bloco {bloco+1}: {i+1:,}/{block_size:,} ({pct:.1f}%) — {tempo_decorrido:.1f}s")
+        # copiar o bloco para os coletores globais
+        faixa = slice(bloco * lotes_por_bloco, (bloco + 1) * lotes_por_bloco)
+        tempos_lista[faixa] = bloco_coletor_lista
+        tempos_dict[faixa] = bloco_coletor_dict
 
         # calcular estatísticas do bloco e armazenar
         stats_l = calcular_estatisticas_simples(bloco_coletor_lista)
         stats_d = calcular_estatisticas_simples(bloco_coletor_dict)
+        parciais_lista.append(stats_l)
+        parciais_dict.append(stats_d)
 
         bloco_stats: BlocoStats = {
             "bloco": bloco + 1,
-            "n": stats_l["n"],
+            "n_lotes": int(stats_l["n"]),
+            "n_buscas": int(stats_l["n"]) * TAMANHO_LOTE,
             "lista_media": stats_l["media"],
             "lista_mediana": stats_l["mediana"],
             "lista_pstdev": stats_l["pstdev"],
@@ -327,20 +703,15 @@ def executar_experimento_por_blocos() -> None:
         }
         estatisticas_blocos.append(bloco_stats)
 
-        tempo_fim_bloco = time.perf_counter()
-        print(f"Bloco {bloco+1} concluído em {tempo_fim_bloco - inicio_bloco:.1f}s\n")
-
-    tempo_fim_total = time.perf_counter()
-    print(f"Coleta completa. Tempo total: {tempo_fim_total - tempo_inicio_total:.1f}s\n")
-
     # salvar amostras e estatísticas por bloco
     salvar_amostras_csv(amostras)
+    parquet_salvo = salvar_amostras_parquet(amostras)
     salvar_estatisticas_blocos_csv(estatisticas_blocos)
 
     # calcular e salvar estatísticas globais
-    stats_glob_lista = calcular_estatisticas_simples(list(tempos_lista))
-    stats_glob_dict = calcular_estatisticas_simples(list(tempos_dict))
-    salvar_estatisticas_completas_txt(stats_glob_lista, stats_glob_dict)
+    stats_glob_lista = combinar_estatisticas(parciais_lista, tempos_lista)
+    stats_glob_dict = combinar_estatisticas(parciais_dict, tempos_dict)
+    salvar_estatisticas_completas_txt(stats_glob_lista, stats_glob_dict, sobrecargas_blocos, semente_raiz.entropy)
 
     # impressão resumo
     print("RESUMO ESTATÍSTICO GLOBAL (exemplo resumido):")
@@ -348,6 +719,10 @@ def executar_experimento_por_blocos() -> None:
     print(f"- DICIONÁRIO: média = {stats_glob_dict['media']:.2f} ns, mediana = {stats_glob_dict['mediana']:.2f} ns, pstdev = {stats_glob_dict['pstdev']:.2f} ns")
     print("\nArquivos gerados:")
     print("- resultados_amostras.csv")
+    if parquet_salvo:
+        print("- resultados_amostras.parquet")
+    else:
+        print("  (resultados_amostras.parquet não gerado: instale pyarrow para Parquet)")
     print("- estatisticas_blocos.csv")
     print("- estatisticas_completas.txt")
     print("\nExperimento finalizado com sucesso.")
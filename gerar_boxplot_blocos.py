@@ -6,25 +6,20 @@ Gera boxplots por bloco, usando estatisticas_blocos.csv.
 Permite visualizar a estabilidade dos blocos.
 """
 
-import csv
+import numpy as np
+import pandas as pd
 import matplotlib.pyplot as plt
 
 ARQUIVO = "estatisticas_blocos.csv"
 
 
 def carregar_estatisticas_por_bloco(caminho):
-    blocos = []
-    lista_medianas = []
-    dicionario_medianas = []
-
-    with open(caminho, "r") as f:
-        leitor = csv.DictReader(f)
-        for linha in leitor:
-            blocos.append(int(linha["bloco"]))
-            lista_medianas.append(float(linha["lista_mediana"]))
-            dicionario_medianas.append(float(linha["dict_mediana"]))
-
-    return blocos, lista_medianas, dicionario_medianas
+    df = pd.read_csv(
+        caminho,
+        usecols=["bloco", "lista_mediana", "dict_mediana"],
+        dtype={"bloco": np.int64, "lista_mediana": np.float64, "dict_mediana": np.float64},
+    )
+    return df["bloco"].to_numpy(), df["lista_mediana"].to_numpy(), df["dict_mediana"].to_numpy()
 
 
 def gerar_boxplot_blocos(blocos, lista_medianas, dicionario_medianas):
@@ -8,7 +8,7 @@ Script para geração de gráficos do experimento:
 - Densidade aproximada (por histogramas normalizados)
 
 Entrada:
-    resultados_amostras.csv
+    resultados_amostras.parquet (se existir, ao lado do CSV) ou resultados_amostras.csv
         colunas: valor, tempo_lista_ns, tempo_dict_ns
 
 Saída:
@@ -17,68 +17,103 @@ Saída:
     densidade.png
 """
 
-import csv
+import os
+import numpy as np
+import pandas as pd
+import matplotlib
+matplotlib.use("Agg")  # backend sem interface gráfica: só gravamos PNGs
 import matplotlib.pyplot as plt
 
 ARQUIVO = "resultados_amostras.csv"
+COLUNAS = ["tempo_lista_ns", "tempo_dict_ns"]
+
+
+def caminho_parquet(caminho):
+    # Parquet gravado junto com o CSV, com o mesmo nome base
+    return os.path.splitext(caminho)[0] + ".parquet"
+
+
+def ler_amostras(caminho):
+    # Parquet primeiro (mais rápido de recarregar), se existir e houver engine
+    if os.path.exists(caminho_parquet(caminho)):
+        try:
+            return pd.read_parquet(caminho_parquet(caminho), columns=COLUNAS)
+        except ImportError:
+            pass
+    # colunas fixas do produtor: valor, tempo_lista_ns, tempo_dict_ns;
+    # memory_map deixa o kernel paginar o arquivo e low_memory=False lê em um só bloco
+    return pd.read_csv(
+        caminho,
+        sep=",",
+        engine="c",
+        memory_map=True,
+        low_memory=False,
+        usecols=COLUNAS,
+        dtype={coluna: np.int64 for coluna in COLUNAS},
+    )
 
 
 def carregar_dados(caminho):
-    tempos_lista = []
-    tempos_dict = []
+    df = ler_amostras(caminho)
+    return df["tempo_lista_ns"].to_numpy(), df["tempo_dict_ns"].to_numpy()
 
-    with open(caminho, "r") as f:
-        leitor = csv.DictReader(f)
-        for linha in leitor:
-            tempos_lista.append(int(linha["tempo_lista_ns"]))
-            tempos_dict.append(int(linha["tempo_dict_ns"]))
 
-    return tempos_lista, tempos_dict
+def gerar_boxplot(fig, ax, tempos_lista, tempos_dict):
+    ax.clear()
+    ax.boxplot([tempos_lista, tempos_dict], labels=["Lista", "Dicionário"])
+    ax.set_title("Boxplot — Tempos de Busca (ns)")
+    ax.set_ylabel("Tempo (ns)")
+    fig.savefig("boxplot.png", dpi=300, bbox_inches="tight")
 
 
-def gerar_boxplot(tempos_lista, tempos_dict):
-    plt.figure()
-    plt.boxplot([tempos_lista, tempos_dict], labels=["Lista", "Dicionário"])
-    plt.title("Boxplot — Tempos de Busca (ns)")
-    plt.ylabel("Tempo (ns)")
-    plt.savefig("boxplot.png", dpi=300, bbox_inches="tight")
-    plt.close()
+def _histogramas_sobrepostos(ax, tempos_lista, tempos_dict, bins, density):
+    # bordas comuns às duas séries, para que as barras fiquem alinhadas;
+    # cada histograma vira um único artista (stairs) em vez de um retângulo por barra
+    minimo = min(np.min(tempos_lista), np.min(tempos_dict))
+    maximo = max(np.max(tempos_lista), np.max(tempos_dict))
+    bordas = np.linspace(minimo, maximo, bins + 1)
+    contagem_lista, _ = np.histogram(tempos_lista, bins=bordas, density=density)
+    contagem_dict, _ = np.histogram(tempos_dict, bins=bordas, density=density)
+    ax.stairs(contagem_lista, bordas, fill=True, alpha=0.5, label="Lista")
+    ax.stairs(contagem_dict, bordas, fill=True, alpha=0.5, label="Dicionário")
+    ax.legend()
 
 
-def gerar_histograma(tempos_lista, tempos_dict):
-    plt.figure()
-    plt.hist(tempos_lista, bins=50, alpha=0.5)
-    plt.hist(tempos_dict, bins=50, alpha=0.5)
-    plt.title("Histograma — Tempos de Busca (ns)")
-    plt.xlabel("Tempo (ns)")
-    plt.ylabel("Frequência")
-    plt.savefig("histograma.png", dpi=300, bbox_inches="tight")
-    plt.close()
+def gerar_histograma(fig, ax, tempos_lista, tempos_dict):
+    ax.clear()
+    _histogramas_sobrepostos(ax, tempos_lista, tempos_dict, bins=50, density=False)
+    ax.set_title("Histograma — Tempos de Busca (ns)")
+    ax.set_xlabel("Tempo (ns)")
+    ax.set_ylabel("Frequência")
+    fig.savefig("histograma.png", dpi=300, bbox_inches="tight")
 
 
-def gerar_densidade(tempos_lista, tempos_dict):
-    plt.figure()
-    plt.hist(tempos_lista, bins=80, density=True, alpha=0.5)
-    plt.hist(tempos_dict, bins=80, density=True, alpha=0.5)
-    plt.title("Densidade Aproximada — Lista vs Dicionário")
-    plt.xlabel("Tempo (ns)")
-    plt.ylabel("Densidade Aproximada")
-    plt.savefig("densidade.png", dpi=300, bbox_inches="tight")
-    plt.close()
+def gerar_densidade(fig, ax, tempos_lista, tempos_dict):
+    ax.clear()
+    _histogramas_sobrepostos(ax, tempos_lista, tempos_dict, bins=80, density=True)
+    ax.set_title("Densidade Aproximada — Lista vs Dicionário")
+    ax.set_xlabel("Tempo (ns)")
+    ax.set_ylabel("Densidade Aproximada")
+    fig.savefig("densidade.png", dpi=300, bbox_inches="tight")
 
 
 def main():
     print("Carregando dados...")
     tempos_lista, tempos_dict = carregar_dados(ARQUIVO)
 
+    # uma única figura reutilizada pelos três gráficos
+    fig, ax = plt.subplots()
+
     print("Gerando boxplot...")
-    gerar_boxplot(tempos_lista, tempos_dict)
+    gerar_boxplot(fig, ax, tempos_lista, tempos_dict)
 
     print("Gerando histograma...")
-    gerar_histograma(tempos_lista, tempos_dict)
+    gerar_histograma(fig, ax, tempos_lista, tempos_dict)
 
     print("Gerando densidade...")
-    gerar_densidade(tempos_lista, tempos_dict)
+    gerar_densidade(fig, ax, tempos_lista, tempos_dict)
+
+    plt.close(fig)
 
     print("\nGráficos gerados com sucesso:")
     print("- boxplot.png")